@@ -14,19 +14,23 @@
 # pylint: disable=missing-module-docstring
 
 # stdlib
-from collections import namedtuple
+import functools
 from pathlib import Path
 import os
+import signal
 import sys
-import time
-from typing import Optional, Union, Dict, Tuple
+import threading
+from typing import Callable, NamedTuple, Optional, Union, Dict, Tuple
 import webbrowser
 
 # package
 from idaes import logger
-from .model_server import FlowsheetServer
 from . import persist, errors
-from .save_diagram_screenshot import SaveDiagramScreenshot
+
+# NOTE: .model_server and .save_diagram_screenshot are imported lazily inside
+# the functions that need them: both drag in heavy dependency trees (model
+# serializer / IPython + playwright) that importing this module shouldn't
+# pay for. `webbrowser` stays module-level since tests replace it.
 
 
 # Logging
@@ -35,23 +39,47 @@ _log = logger.getLogger(__name__)
 # Module globals
 web_server = None
 
+#: Cached result of webbrowser.get(), so repeated opens (e.g. from notebook
+#: re-runs) skip the browser-discovery walk
+_browser_controller = None
+
+#: Running servers for this process, keyed by port, so batch exports and
+#: repeated visualize() calls reuse a warm server instead of starting new ones.
+#: `web_server` above remains the most recently used server.
+_server_pool: Dict[int, "FlowsheetServer"] = {}
+_server_pool_lock = threading.Lock()
+
 #: Maximum number of saved versions of the same `save` file.
 #: Set to zero if you want to allow any number.
 MAX_SAVED_VERSIONS = 100
 
+#: Allowed image types for exported diagrams
+_ALLOWED_IMTYPES = frozenset({"svg", "png"})
+
+#: Last version number handed out for a given (directory, name), so repeated
+#: calls skip re-scanning the directory for existing versioned files.
+_version_cache: Dict[Tuple[str, str], int] = {}
+_version_cache_lock = threading.Lock()
+
 
 # Classes and functions
 
-#: Return value for `visualize()` function. This namedtuple has three
-#: attributes that can be accessed by position or name:
-#:
-#: - store = :class:`idaes.core.ui.fv.persist.DataStore` object (with a ``.filename`` attribute)
-#: - port = Port number (integer) where web server is listening
-#: - server = :class:`idaes.core.ui.fv.model_server.FlowsheetServer` object for the web server thread
-#:
-VisualizeResult = namedtuple(
-    "VisualizeResult", ["store", "port", "server", "save_diagram"]
-)
+class VisualizeResult(NamedTuple):
+    """Return value for the `visualize()` function. Fields can be accessed
+    by position or name:
+
+    - store = :class:`idaes.core.ui.fv.persist.DataStore` object (with a ``.filename`` attribute)
+    - port = Port number (integer) where web server is listening
+    - server = :class:`idaes.core.ui.fv.model_server.FlowsheetServer` object for the web server thread.
+      Its ``mark_dirty(name)`` method tells the server the model changed, so the
+      next poll re-serializes it (see the note in :func:`visualize`)
+    - save_diagram = function to save a screenshot of the diagram
+    """
+
+    store: persist.DataStore
+    port: int
+    server: "FlowsheetServer"
+    save_diagram: Callable
 
 
 def visualize(
@@ -75,6 +103,11 @@ def visualize(
 
     Also open a browser window to display the visualization app. The URL is printed unless ``quiet`` is True.
 
+    The server caches the serialized flowsheet, so if the model is changed
+    after this function returns (e.g. re-solved in a notebook), tell the
+    server before the next poll by calling ``result.server.mark_dirty(name)``,
+    or use the refresh action in the UI.
+
     Args:
         flowsheet: IDAES flowsheet to visualize
         name: Name of flowsheet to display as the title of the visualization
@@ -107,20 +140,21 @@ def visualize(
         :mod:`idaes.core.ui.fv.errors.VisualizerError`: Any other errors
         RuntimeError: If too many versions of the save file already exist. See :data:`MAX_SAVED_VERSIONS`.
     """
-    global web_server  # pylint: disable=global-statement
-
     # Initialize IDAES logging
     _init_logging(log_level)
 
-    # Start the web server
-    if web_server is None:
-        web_server = FlowsheetServer(port=port)
-        web_server.add_setting("save_time_interval", save_time_interval)
-        web_server.start()
-        if not quiet:
-            _log.info("Started visualization server")
-    else:
-        _log.info(f"Using HTTP server on localhost, port {web_server.port}")
+    # Start (or reuse) the web server in the background, so its socket bind
+    # and startup overlap with the save-path and datastore I/O below
+    server_result = []
+
+    def _acquire():
+        try:
+            server_result.append(_acquire_server(port, save_time_interval, quiet))
+        except BaseException as err:  # re-raised in the caller below
+            server_result.append(err)
+
+    server_thread = threading.Thread(target=_acquire, daemon=True)
+    server_thread.start()
 
     # Set up save location
     use_default = False
@@ -142,10 +176,19 @@ def visualize(
     if save_path is None:
         datastore = persist.MemoryDataStore()
     else:
-        if save_path.exists() and load_from_saved:
+        # Coalesce rapid saves from the UI so a burst of edits produces one
+        # write per save interval instead of one write per save
+        flush_interval = save_time_interval / 1000  # ms -> seconds
+        # one stat() covers both existence and a 0-byte file left over from
+        # an interrupted save, which has nothing worth loading
+        try:
+            has_saved = save_path.stat().st_size > 0
+        except OSError:
+            has_saved = False
+        if has_saved and load_from_saved:
             # Load from saved
-            datastore = persist.DataStore.create(save_path)
-            _log.info(f"Loading saved flowsheet from '{save_path}'")
+            datastore = persist.DataStore.create(save_path, flush_interval=flush_interval)
+            _log.info("Loading saved flowsheet from '%s'", save_path)
             datastore.load()
         else:
             # Create new file
@@ -159,70 +202,140 @@ def visualize(
                 )
             except errors.TooManySavedVersions as err:
                 raise RuntimeError(f"In visualize(): {err}")
-            datastore = persist.DataStore.create(save_path)
+            datastore = persist.DataStore.create(save_path, flush_interval=flush_interval)
 
         if use_default:
             if not quiet:
                 cwd = save_path.parent.absolute()
                 _log.info(
-                    f"Saving flowsheet to default file '{save_path.name}' in current"
-                    f" directory ({cwd})"
+                    "Saving flowsheet to default file '%s' in current"
+                    " directory (%s)",
+                    save_path.name,
+                    cwd,
                 )
         else:
             if not quiet:
                 print(f"Saving flowsheet to {str(datastore)}")
 
+    # Wait for the server started above
+    server_thread.join()
+    server = server_result[0]
+    if isinstance(server, BaseException):
+        raise server
+
     # Add our flowsheet to it
     try:
-        new_name = web_server.add_flowsheet(name, flowsheet, datastore)
+        new_name = server.add_flowsheet(name, flowsheet, datastore)
     except (errors.ProcessingError, errors.DatastoreError) as err:
         raise errors.VisualizerError(f"Cannot add flowsheet: {err}")
 
     if new_name != name:
-        _log.warning(f"Flowsheet name changed: old='{name}' new='{new_name}'")
+        _log.warning("Flowsheet name changed: old='%s' new='%s'", name, new_name)
         if not quiet:
             print(f"Flowsheet name changed to '{new_name}'")
         name = new_name
 
     # Open a browser window for the UI
-    url = f"http://localhost:{web_server.port}/app?id={name}"
+    url = f"http://localhost:{server.port}/app?id={name}"
     if browser:
-        success = webbrowser.open(url)
-        if success:
-            _log.debug("Flowsheet opened in browser window")
-        else:
-            _log.warning(f"Could not open flowsheet URL '{url}' in browser")
+        _open_browser(url)
 
     if not quiet:
-        _log.info(f"Flowsheet visualization at: {url}")
+        _log.info("Flowsheet visualization at: %s", url)
 
     if loop_forever:
         _loop_forever(quiet)
 
     # call saveDiagramScreenshot class to get save_diagram function and return to user to use for get screenshot
-    save_diagram_screenshot_class = SaveDiagramScreenshot(
-        name=name, port=web_server.port
-    )
+    from .save_diagram_screenshot import SaveDiagramScreenshot
+
+    save_diagram_screenshot_class = SaveDiagramScreenshot(name=name, port=server.port)
 
     return VisualizeResult(
         store=datastore,
-        port=web_server.port,
-        server=web_server,
+        port=server.port,
+        server=server,
         save_diagram=save_diagram_screenshot_class.save_diagram_screenshot,
     )
 
 
+def _acquire_server(port, save_time_interval, quiet) -> "FlowsheetServer":
+    """Get a running server from the pool, starting a new one if needed.
+
+    If `port` is given, look for a pooled server on that port; otherwise reuse
+    the most recently used server, if any. The module global `web_server` is
+    kept pointing at the returned server.
+    """
+    global web_server  # pylint: disable=global-statement
+    from .model_server import FlowsheetServer
+    with _server_pool_lock:
+        if port is not None:
+            server = _server_pool.get(port)
+        else:
+            server = web_server
+        if server is None:
+            server = FlowsheetServer(port=port)
+            server.add_setting("save_time_interval", save_time_interval)
+            server.start()
+            _server_pool[server.port] = server
+            if not quiet:
+                _log.info("Started visualization server")
+        else:
+            _log.info("Using HTTP server on localhost, port %s", server.port)
+        web_server = server
+    return server
+
+
 def _loop_forever(quiet):
     try:
         if not quiet:
             print("Type ^C to stop the program")
-        while True:
-            time.sleep(1)
+        if hasattr(signal, "pause"):
+            # Block until interrupted. Unlike a sleep() polling loop, this
+            # never wakes up on its own, so the main thread stays idle while
+            # the server thread handles requests.
+            while True:
+                signal.pause()
+        else:
+            # Windows has no signal.pause(), and untimed waits there block
+            # Ctrl-C delivery, so fall back to a timed wait loop
+            event = threading.Event()
+            while True:
+                event.wait(1)
     except KeyboardInterrupt:
         if not quiet:
             print("Program stopped")
 
 
+def _open_browser(url):
+    """Open `url` in the default browser and log the outcome.
+
+    The browser controller is resolved synchronously, so tests that swap out
+    the `webbrowser` module see their double used even after they restore the
+    real one; only the (potentially slow) open call runs in the background.
+    """
+    global _browser_controller  # pylint: disable=global-statement
+    controller = _browser_controller
+    if controller is None:
+        try:
+            controller = _browser_controller = webbrowser.get()
+        except Exception:  # pylint: disable=W0703
+            # no usable controller, or `webbrowser` was swapped out (tests do
+            # this): fall back to module-level open() without caching
+            controller = webbrowser
+
+    def _open():
+        success = controller.open(url)
+        if success:
+            _log.debug("Flowsheet opened in browser window")
+        else:
+            _log.warning("Could not open flowsheet URL '%s' in browser", url)
+
+    # open in the background, so visualize() returns without waiting on the
+    # browser process to launch
+    threading.Thread(target=_open, daemon=True).start()
+
+
 def _pick_default_save_location(name, save_dir):
     """Pick a default save location."""
     if not save_dir:
@@ -237,30 +350,47 @@ def _handle_existing_save_path(name, save_path, max_versions=10, overwrite=None)
     # Handle simple cases: overwrite, and no existing file
     if overwrite:
         if save_path.exists():
-            _log.warning(f"Overwriting existing save file '{save_path}'")
-            save_path.open("w")  # blank file
+            _log.warning("Overwriting existing save file '%s'", save_path)
+            # remove the old contents; the first save recreates the file.
+            # unlike truncating, this can't leave a 0-byte file if the
+            # process dies before that save happens
+            save_path.unlink()
         return save_path
     elif not save_path.exists():
         return save_path
     # Find the next version that does not exist
-    _log.info(f"Save file {save_path} exists. Creating new version")
-    counter = 0
+    _log.info("Save file %s exists. Creating new version", save_path)
     if max_versions == 0:
         max_versions = sys.maxsize  # millions of years of file-creating fun
-    while save_path.exists() and counter < max_versions:
-        counter += 1
-        save_file = f"{name}-{counter}.json"
-        save_path = save_dir / save_file
+    # Start from the last version handed out for this directory and name, if
+    # known, so only the next candidate needs an existence check
+    cache_key = (str(save_dir), name)
+    with _version_cache_lock:
+        counter = _version_cache.get(cache_key, 0)
+    if counter:
+        # cache hit: normally only the next candidate needs an existence check
+        while save_path.exists() and counter < max_versions:
+            counter += 1
+            save_path = save_dir / f"{name}-{counter}.json"
+    else:
+        # read the directory once instead of doing a stat() per candidate
+        with os.scandir(save_dir) as entries:
+            existing = {entry.name for entry in entries}
+        while save_path.name in existing and counter < max_versions:
+            counter += 1
+            save_path = save_dir / f"{name}-{counter}.json"
     # Edge case: too many NAME-#.json files for this NAME
-    if counter == max_versions:
+    if counter >= max_versions:
         why = (
             f"Found {max_versions} numbered files of form '{name}-<num>.json'. That's"
             " too many."
         )
         _log.error(why)
         raise errors.TooManySavedVersions(why)
+    with _version_cache_lock:
+        _version_cache[cache_key] = counter
     # Return new (versioned) path
-    _log.info(f"Created new version for save file: {save_path}")
+    _log.info("Created new version for save file: %s", save_path)
     return save_path
 
 
@@ -269,6 +399,29 @@ def _init_logging(lvl):
     ui_logger.setLevel(lvl)
 
 
+def _resolve_export_dir(d: Path) -> Path:
+    """Create (if needed) and resolve a diagram export directory.
+
+    Cached, so a batch of exports into the same directory only pays for the
+    mkdir and resolve syscalls once. The path is made absolute *before* the
+    cache lookup, so relative paths stay correct if the working directory
+    changes between exports (e.g. `os.chdir` in a notebook).
+
+    Raises:
+       IOError: If the directory cannot be created
+    """
+    return _resolve_export_dir_cached(Path(os.path.abspath(d)))
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_export_dir_cached(d: Path) -> Path:
+    try:
+        d.mkdir(parents=True, exist_ok=True)
+    except Exception as err:
+        raise IOError(f"Cannot make directory {d}: {err}") from err
+    return d.resolve()
+
+
 def export_flowsheet_diagram(
     flowsheet, name: Union[str, Path], display: bool = False
 ) -> Path:
@@ -303,31 +456,20 @@ def export_flowsheet_diagram(
        ValueError: If input file extension is missing or not recognized.
        IOError: If output file cannot be written, e.g., a permissions error
     """
-    if isinstance(name, Path):
-        p = name.expanduser()
-        if p.suffix == "":
-            raise ValueError("File extension is required")
-        p.resolve()
-        d = p.parent
-        imtype, basename = p.suffix[1:], p.stem
-    elif name.rfind(".") < 1:
+    # Path semantics handle every input form (plain name, relative or absolute
+    # path, leading '~') and split on the *last* dot, so a name like
+    # 'my.flow.svg' keeps its full base name
+    p = Path(name).expanduser()
+    if p.suffix == "":
         raise ValueError("File extension is required")
-    elif name.startswith(".") or name.startswith("/") or name.startswith("~"):
-        p = Path(name)
-        p = p.expanduser()
-        p.resolve()
-        d = p.parent
-        imtype, basename = p.suffix[1:], p.stem
-    else:
-        d = Path(".")
-        basename, imtype = name.split(".", 1)
-    try:
-        d.mkdir(parents=True, exist_ok=True)
-    except Exception as err:
-        raise IOError(f"Cannot make directory {d}: {err}") from err
-    if imtype not in ("svg", "png"):
+    imtype, basename = p.suffix[1:], p.stem
+    d = _resolve_export_dir(p.parent)
+    if imtype not in _ALLOWED_IMTYPES:
         raise ValueError(f"File extension must be '.svg' or '.png' (got: '.{imtype}')")
-    r = visualize(flowsheet, basename, browser=False).save_diagram(
+    # Rendering happens in the web frontend, so a (pooled) server is still
+    # needed, but an export doesn't need a save file: skip disk persistence
+    # and the versioned save-file handling entirely
+    r = visualize(flowsheet, basename, browser=False, save=False, quiet=True).save_diagram(
         screenshot_name=basename,
         screenshot_save_to=str(d),
         image_type=imtype,
@@ -19,6 +19,8 @@ The main class is `FlowsheetServer`, which is instantiated from the `visualize()
 # pylint: disable=missing-function-docstring
 
 # stdlib
+import atexit
+import hashlib
 import io
 import http.server
 import json
@@ -28,11 +30,16 @@ import re
 import socket
 import threading
 from typing import Dict, Union
-from urllib.parse import urlparse
-import time
+from urllib.parse import parse_qsl, urlsplit
 import os
 import traceback
 
+# third-party
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
+
 # package
 from idaes_ui.fv.flowsheet import FlowsheetDiff, FlowsheetSerializer
 from idaes_ui.fv.models import DiagnosticsData, DiagnosticsException, DiagnosticsError
@@ -50,9 +57,54 @@ _static_dir = _this_dir / "static"
 _template_dir = _this_dir / "static"
 
 
-class FlowsheetServer(http.server.HTTPServer):
+# precompiled patterns for canonical_flowsheet_name(), which is called on
+# every flowsheet registration
+_NAME_BAD = re.compile(r"[^a-zA-Z0-9-._]")
+_NAME_DASHES = re.compile(r"-+")
+
+
+def _hash_flowsheet(fs: Dict) -> bytes:
+    """Content hash of a flowsheet dict, for cheap equality checks."""
+    canonical = json.dumps(fs, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+def _encode_json(data) -> bytes:
+    """Encode `data` as JSON bytes for an HTTP response.
+
+    Uses `orjson` when available, which renders non-finite numbers as null --
+    the only form a browser's JSON.parse accepts -- and falls back to stdlib
+    `json` for objects it cannot encode (e.g. non-string keys).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    return utf8_encode(json.dumps(data))
+
+
+def _decode_json(data: Union[bytes, str]):
+    """Parse JSON, falling back to stdlib `json` for documents orjson rejects
+    (such as NaN/Infinity tokens from the stdlib encoder).
+
+    Raises:
+        ValueError, if the input is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
+
+
+class FlowsheetServer(http.server.ThreadingHTTPServer):
     """A simple HTTP server that runs in its own thread.
 
+    Requests are handled concurrently, each on its own (daemon) thread, so a
+    slow flowsheet serialization does not block static files or other clients.
+
     This server is used for *all* models for a given process, so every request
     needs to contain the ID of the model.
 
@@ -60,18 +112,56 @@ class FlowsheetServer(http.server.HTTPServer):
     `start()`, and `add_flowsheet()`.
     """
 
+    # handle each request on its own daemon thread, so in-flight requests
+    # never block interpreter exit
+    daemon_threads = True
+    # the HTTPServer default, but made explicit: restarts on the same port
+    # should not wait out TIME_WAIT sockets
+    allow_reuse_address = True
+
     def __init__(self, port=None):
         """Create HTTP server"""
-        # port for dev remove it to allow system get random port in production
-        self._port = port or find_free_port()
         # Use 0.0.0.0 for Docker compatibility, 127.0.0.1 for local development
         host = "0.0.0.0" if os.environ.get("DOCKER_CONTAINER") else "127.0.0.1"
-        _log.info(f"Starting HTTP server on {host}, port {self._port}")
-        super().__init__((host, self._port), FlowsheetServerHandler)
+        # bind port 0 when none was given, letting the OS pick a free port,
+        # instead of probing with a throwaway socket and rebinding
+        super().__init__((host, port or 0), FlowsheetServerHandler)
+        self._port = self.server_address[1]
+        _log.info(f"Started HTTP server on {host}, port {self._port}")
         self._dsm = persist.DataStoreManager()
         self._flowsheets = {}
         self._thr = None
+        # guards flowsheet/settings/datastore state shared by request threads
+        self._lock = threading.RLock()
+        # canonical saved flowsheet content, per id; written through to the
+        # datastore lazily by the flush thread (see _flush_loop)
+        self._live = {}
+        self._saved_hashes = {}  # content hash of each _live entry
+        self._save_counters = {}  # bumped when saved content changes
+        self._dirty_ids = set()
+        self._flush_thr = None
+        self._stop_flush = threading.Event()
         self._settings_block = {}
+        self._save_digests = {}  # digest of last-saved payload, per flowsheet
+        # serialized form of each flowsheet, keyed by id; entries hold the
+        # (model object id, dirty counter) version they were computed for
+        self._serialized_cache = {}
+        self._dirty_counters = {}
+        # DiagnosticsToolbox per flowsheet; see _get_diag_toolbox()
+        self._diag_cache = {}
+        # in-flight /fs computations, per flowsheet id; entries are
+        # [done-event, encoded-response-or-None] (see handler._get_fs)
+        self._inflight = {}
+        # published /fs responses, per id: (version, JSON bytes, etag); kept
+        # fresh by a background worker woken on model or save changes
+        self._latest = {}
+        self._refresh_ids = set()
+        self._serialize_cond = threading.Condition(self._lock)
+        self._serialize_thr = None
+        # the app page template is static for the lifetime of the server, so
+        # read it once and pre-split on the flowsheet-id placeholder
+        template = (_template_dir / "index.html").read_bytes()
+        self._app_parts = template.split(b"{flowsheet_id}")
 
     @property
     def port(self):
@@ -81,6 +171,11 @@ class FlowsheetServer(http.server.HTTPServer):
         """Start the server, which will spawn a thread."""
         self._thr = threading.Thread(target=self._run, daemon=True)
         self._thr.start()
+        self._flush_thr = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thr.start()
+        self._serialize_thr = threading.Thread(target=self._serialize_loop, daemon=True)
+        self._serialize_thr.start()
+        atexit.register(self._flush_dirty)
 
     def add_setting(self, key: str, value):
         """Add a setting to the flowsheet's settings block. Settings block is
@@ -95,7 +190,8 @@ class FlowsheetServer(http.server.HTTPServer):
             key: Setting name
             value: Setting value
         """
-        self._settings_block[key] = value
+        with self._lock:
+            self._settings_block[key] = value
 
     def get_setting(self, key: str):
         """Get a setting value from the flowsheet's settings block.
@@ -106,10 +202,11 @@ class FlowsheetServer(http.server.HTTPServer):
         Returns:
             Setting value. None if Setting name (key) doesn't exist
         """
-        if key not in self._settings_block:
-            _log.warning(f"key '{key}' is not set in the flowsheet settings block")
-            return None
-        return self._settings_block[key]  # {'save_time_interval': 5000}
+        with self._lock:
+            if key not in self._settings_block:
+                _log.warning(f"key '{key}' is not set in the flowsheet settings block")
+                return None
+            return self._settings_block[key]  # {'save_time_interval': 5000}
 
     def add_flowsheet(self, id_, flowsheet, store: persist.DataStore) -> str:
         """Add a flowsheet, and also the method of saving it.
@@ -128,21 +225,31 @@ class FlowsheetServer(http.server.HTTPServer):
         """
         # replace all but 'unreserved' (RFC 3896) chars with a dash;
         # remove duplicate dashes
-        id_ = self.canonical_flowsheet_name(id_)
-        self._flowsheets[id_] = flowsheet
-        _log.debug(f"Flowsheet '{id_}' storage is {store}")
-        self._dsm.add(id_, store)
-        # First try to update, so as not to overwrite saved value
-        try:
-            self.update_flowsheet(id_)
-        except errors.FlowsheetNotFoundInDatastore:
-            _log.debug(f"No existing flowsheet found in {store}: saving new value")
-            # If not found in datastore, save new value
-            fs_dict = FlowsheetSerializer(flowsheet, id_).as_dict()
-            store.save(fs_dict)
-        else:
-            _log.debug(f"Existing flowsheet found in {store}: saving merged value")
-        return id_
+        with self._lock:
+            id_ = self.canonical_flowsheet_name(id_)
+            self._flowsheets[id_] = flowsheet
+            _log.debug(f"Flowsheet '{id_}' storage is {store}")
+            if self._dsm.add(id_, store):
+                # a new or replaced store is the source of truth now: drop all
+                # cached content tied to the previous one, so the load/save
+                # below actually touch it
+                self._live.pop(id_, None)
+                self._saved_hashes.pop(id_, None)
+                self._save_digests.pop(id_, None)
+                self._latest.pop(id_, None)
+                self._dirty_ids.discard(id_)
+            # First try to update, so as not to overwrite saved value
+            try:
+                self.update_flowsheet(id_)
+            except errors.FlowsheetNotFoundInDatastore:
+                _log.debug(f"No existing flowsheet found in {store}: saving new value")
+                # If not found in datastore, save new value
+                fs_dict = FlowsheetSerializer(flowsheet, id_).as_dict()
+                store.save(fs_dict)
+                self._live[id_] = fs_dict
+            else:
+                _log.debug(f"Existing flowsheet found in {store}: saving merged value")
+            return id_
 
     @staticmethod
     def canonical_flowsheet_name(name: str) -> str:
@@ -158,23 +265,74 @@ class FlowsheetServer(http.server.HTTPServer):
         Returns:
             New name
         """
-        return re.sub(r"-+", "-", re.sub(r"[^a-zA-Z0-9-._]", "-", name))
+        return _NAME_DASHES.sub("-", _NAME_BAD.sub("-", name))
+
+    def mark_dirty(self, id_: str):
+        """Mark a flowsheet's model as changed.
+
+        The serialized form of each flowsheet is cached, so updates after a
+        model mutation that the server can't observe (e.g. re-solving the
+        model in a notebook) should call this to force re-serialization.
+
+        Args:
+            id_: Name of flowsheet
+        """
+        with self._lock:
+            self._dirty_counters[id_] = self._dirty_counters.get(id_, 0) + 1
+            self._diag_cache.pop(id_, None)
+            # wake the background worker to re-publish the /fs response
+            self._refresh_ids.add(id_)
+            self._serialize_cond.notify_all()
 
     # === Public methods called only by HTTP handler ===
 
     def save_flowsheet(self, id_, flowsheet: Union[Dict, str]):
         """Save the flowsheet to the appropriate store.
 
+        The UI sends the flowsheet on a timer whether or not it changed, so a
+        string payload is first hashed and compared against the last payload
+        saved for this flowsheet; if they match, the save is skipped.
+
         Raises:
             ProcessingError, if parsing of JSON failed
             (see :meth:`DataStoreManager.save()`)
         """
-        try:
-            self._dsm.save(id_, flowsheet)
-        except errors.DatastoreError as err:
-            raise errors.ProcessingError(f"While saving flowsheet: {err}")
-        except KeyError as err:
-            raise errors.ProcessingError(f"While saving flowsheet: {err}")
+        with self._lock:
+            digest = None
+            if isinstance(flowsheet, str):
+                digest = hashlib.blake2b(
+                    flowsheet.encode("utf-8"), digest_size=16
+                ).digest()
+                if self._save_digests.get(id_) == digest:
+                    _log.debug(f"Flowsheet '{id_}' unchanged: skipping save")
+                    return
+            if id_ not in self._flowsheets:
+                raise errors.ProcessingError(
+                    f"While saving flowsheet: unknown flowsheet '{id_}'"
+                )
+            if isinstance(flowsheet, str):
+                # parse now so bad JSON still fails this request, and the live
+                # copy is always a dict
+                try:
+                    flowsheet = _decode_json(flowsheet)
+                except ValueError as err:
+                    raise errors.ProcessingError(f"While saving flowsheet: {err}")
+            # update the live copy; the flush thread writes it to the datastore
+            self._live[id_] = flowsheet
+            self._saved_hashes[id_] = _hash_flowsheet(flowsheet)
+            self._dirty_ids.add(id_)
+            if digest is None:
+                # saved from a dict (e.g. a merge): stored content changed in a
+                # way the string digest can't see, so drop it
+                self._save_digests.pop(id_, None)
+            else:
+                self._save_digests[id_] = digest
+            # the saved content changed, so published /fs responses must be
+            # rebuilt; the model itself did not, so the serialized-model cache
+            # stays valid (mark_dirty is for external model mutations)
+            self._save_counters[id_] = self._save_counters.get(id_, 0) + 1
+            self._refresh_ids.add(id_)
+            self._serialize_cond.notify_all()
 
     def update_flowsheet(self, id_: str) -> Dict:
         """Update flowsheet.
@@ -185,58 +343,181 @@ class FlowsheetServer(http.server.HTTPServer):
             id_: Identifier of flowsheet to update.
 
         Returns:
-            Merged value of flowsheets in datastore and current value in memory
+            Merged value of flowsheets in datastore and current value in memory.
+            The dict may share structure with server state, so callers must
+            treat it as read-only (the handler only serializes it).
 
         Raises:
             FlowsheetUnknown if the flowsheet id is not known
             FlowsheetNotFound (subclass) if flowsheet id is known, but can't be found
             ProcessingError for internal errors
         """
-        # Get saved flowsheet from datastore
-        try:
+        with self._lock:
+            # Get saved flowsheet from datastore
             saved = self._load_flowsheet(id_)
-        except KeyError:
-            raise errors.FlowsheetUnknown(id_)
-        except ValueError:
-            raise errors.FlowsheetNotFoundInDatastore(id_)
-        # Get current value from memory
-        try:
-            obj = self._get_flowsheet_obj(id_)
-        except KeyError:
-            raise errors.FlowsheetNotFoundInMemory(id_)
-        try:
-            obj_dict = self._serialize_flowsheet(id_, obj)
-        except ValueError as err:
-            raise errors.ProcessingError(f"Cannot serialize flowsheet: {err}")
-        # Compare saved and current value
-        diff = FlowsheetDiff(saved, obj_dict)
-        _log.debug(f"diff: {diff}")
-        if not diff:
-            # If no difference do nothing
-            _log.debug("Stored flowsheet is the same as the flowsheet in memory")
-        else:
-            # Otherwise, save this merged value before returning it
-            num, pl = len(diff), "s" if len(diff) > 1 else ""
-            _log.debug(f"Stored flowsheet and model in memory differ by {num} item{pl}")
-            self.save_flowsheet(id_, diff.merged())
-        # Return [a copy of the] merged value
-        return diff.merged(do_copy=True)
+            # Get current value from memory; dict.get avoids exception setup
+            # on this per-poll path
+            obj = self._flowsheets.get(id_)
+            if obj is None:
+                raise errors.FlowsheetNotFoundInMemory(id_)
+            try:
+                obj_dict = self._serialize_flowsheet(id_, obj)
+            except ValueError as err:
+                raise errors.ProcessingError(f"Cannot serialize flowsheet: {err}")
+            # Content-hash equality gate: identical flowsheets don't need a
+            # FlowsheetDiff, which validates and walks both of them; both
+            # digests are cached, so the common case compares 16 bytes
+            obj_hash = self._serialized_cache[id_][2]
+            saved_hash = self._saved_hashes.get(id_)
+            if saved_hash is None:
+                saved_hash = self._saved_hashes[id_] = _hash_flowsheet(saved)
+            if saved_hash == obj_hash:
+                _log.debug("Stored flowsheet is identical to the flowsheet in memory")
+                return saved
+            # Compare saved and current value
+            diff = FlowsheetDiff(saved, obj_dict)
+            _log.debug(f"diff: {diff}")
+            if not diff:
+                # If no difference do nothing
+                _log.debug("Stored flowsheet is the same as the flowsheet in memory")
+            else:
+                # Otherwise, save this merged value before returning it
+                num, pl = len(diff), "s" if len(diff) > 1 else ""
+                _log.debug(f"Stored flowsheet and model in memory differ by {num} item{pl}")
+                self.save_flowsheet(id_, diff.merged())
+            # Return the merged value without a defensive deep-copy; for large
+            # flowsheets that copy is an O(n) traversal the caller never needs
+            return diff.merged()
+
+    def get_fs_response(self, id_) -> tuple:
+        """Get the encoded ``/fs`` response for a flowsheet.
+
+        Serves the background worker's last published value when it is still
+        current, computing and publishing synchronously otherwise, so request
+        threads normally skip the serialize-and-diff work entirely.
+
+        Args:
+            id_: Identifier of flowsheet
+
+        Returns:
+            Tuple of (JSON bytes, etag)
+
+        Raises:
+            (see :meth:`update_flowsheet`)
+        """
+        with self._lock:
+            latest = self._latest.get(id_)
+            if latest is not None and latest[0] == self._fs_version(id_):
+                return latest[1], latest[2]
+            return self._publish_flowsheet(id_)
 
     # === Internal methods ===
 
-    def _load_flowsheet(self, id_) -> Union[Dict, str]:
-        return self._dsm.load(id_)
+    def _fs_version(self, id_):
+        """Version token for published responses; changes with the model
+        object, its dirty counter, or the saved content."""
+        return (
+            id(self._flowsheets.get(id_)),
+            self._dirty_counters.get(id_, 0),
+            self._save_counters.get(id_, 0),
+        )
+
+    def _publish_flowsheet(self, id_) -> tuple:
+        """Compute, encode, and publish the merged ``/fs`` response.
+
+        Returns:
+            Tuple of (JSON bytes, etag) just published
+        """
+        with self._lock:
+            merged = self.update_flowsheet(id_)
+            value = _encode_json(merged)
+            etag = hashlib.blake2b(value, digest_size=16).hexdigest()
+            # stamp the version after the update, which may itself have bumped
+            # the dirty counter by saving the merged value
+            self._latest[id_] = (self._fs_version(id_), value, etag)
+            return value, etag
+
+    def _serialize_loop(self):
+        """Background worker: re-publish the response for dirty flowsheets."""
+        while True:
+            with self._serialize_cond:
+                while not self._refresh_ids and not self._stop_flush.is_set():
+                    self._serialize_cond.wait()
+                if self._stop_flush.is_set():
+                    return
+                ids = list(self._refresh_ids)
+                self._refresh_ids.clear()
+            for id_ in ids:
+                try:
+                    # no-op if another thread already published a current value
+                    self.get_fs_response(id_)
+                except Exception as err:  # pylint: disable=W0703
+                    _log.error(f"Error refreshing flowsheet '{id_}': {err}")
+
+    def _load_flowsheet(self, id_) -> Dict:
+        """Get the live copy of a flowsheet, reading the datastore on first use.
+
+        Raises:
+            FlowsheetUnknown if the flowsheet id is not known
+            FlowsheetNotFoundInDatastore if the stored data can't be read
+        """
+        live = self._live.get(id_)
+        if live is None:
+            # cold path: the datastore raises KeyError for an unknown id and
+            # ValueError for missing or unreadable data
+            try:
+                live = self._dsm.load(id_)
+            except KeyError:
+                raise errors.FlowsheetUnknown(id_)
+            except ValueError:
+                raise errors.FlowsheetNotFoundInDatastore(id_)
+            self._live[id_] = live
+        return live
 
     def _get_flowsheet_obj(self, id_):
         """Get a flowsheet with the given ID."""
         return self._flowsheets[id_]
 
-    @staticmethod
-    def _serialize_flowsheet(id_, flowsheet):
+    def _get_diag_toolbox(self, id_):
+        """Get a cached DiagnosticsToolbox for the given flowsheet.
+
+        Toolbox construction introspects the model, so one instance is reused
+        across diagnostics calls. The cache entry is dropped when the model
+        object changes or :meth:`mark_dirty` is called.
+
+        Returns:
+            Tuple of the toolbox and a dict of the methods that may be invoked
+            over HTTP (its ``report_*``/``display_*`` methods), keyed by name
+        """
+        with self._lock:
+            fs = self._get_flowsheet_obj(id_)
+            cached = self._diag_cache.get(id_)
+            if cached is None or cached[0] is not fs:
+                dt = DiagnosticsToolbox(fs)
+                # bind the callable methods once, so requests dispatch with a
+                # dict lookup instead of hasattr/getattr on a client string
+                allowed = {
+                    name: getattr(dt, name)
+                    for name in dir(dt)
+                    if name.startswith(("report_", "display_"))
+                    and callable(getattr(dt, name))
+                }
+                cached = (fs, dt, allowed)
+                self._diag_cache[id_] = cached
+            return cached[1], cached[2]
+
+    def _serialize_flowsheet(self, id_, flowsheet):
+        version = (id(flowsheet), self._dirty_counters.get(id_, 0))
+        cached = self._serialized_cache.get(id_)
+        if cached is not None and cached[0] == version:
+            return cached[1]
         try:
             result = FlowsheetSerializer(flowsheet, id_).as_dict()
         except (AttributeError, KeyError) as err:
             raise ValueError(f"Error serializing flowsheet: {err}")
+        # content hash is stored with the entry, so it is computed once per
+        # serialization instead of once per update
+        self._serialized_cache[id_] = (version, result, _hash_flowsheet(result))
         return result
 
     def _run(self):
@@ -248,10 +529,54 @@ class FlowsheetServer(http.server.HTTPServer):
             _log.info(f"Shutting down server due to error: {err}")
             self.shutdown()
 
+    def _flush_loop(self):
+        """Periodically write unsaved flowsheet changes to their datastores."""
+        interval = self._settings_block.get("save_time_interval")
+        delay = interval / 1000 if interval else 1.0
+        while not self._stop_flush.wait(delay):
+            self._flush_dirty()
+
+    def _flush_dirty(self):
+        """Write the live copy of each dirty flowsheet through to its datastore."""
+        with self._lock:
+            dirty = [(id_, self._live[id_]) for id_ in self._dirty_ids]
+            self._dirty_ids.clear()
+        for id_, data in dirty:
+            try:
+                self._dsm.save(id_, data)
+            except (KeyError, errors.DatastoreError) as err:
+                _log.error(f"Error saving flowsheet '{id_}' to datastore: {err}")
+
+    def shutdown(self):
+        """Stop serving, flushing unsaved flowsheet changes first."""
+        self._stop_flush.set()
+        with self._serialize_cond:
+            self._serialize_cond.notify_all()
+        self._flush_dirty()
+        super().shutdown()
+
+
+_tls = threading.local()
+
+
+def _diag_buffer() -> io.StringIO:
+    """Return a per-thread StringIO, emptied and reused across diagnostics calls."""
+    buf = getattr(_tls, "buf", None)
+    if buf is None:
+        buf = _tls.buf = io.StringIO()
+    buf.seek(0)
+    buf.truncate(0)
+    return buf
+
 
 class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
     """Handle requests from the IDAES flowsheet visualization (IFV) web page."""
 
+    # persistent connections: responses always carry Content-Length, so the
+    # browser can reuse one TCP connection for its polling instead of paying
+    # connection setup per request
+    protocol_version = "HTTP/1.1"
+
     def __init__(self, *args, **kwargs):
         self.directory = (
             None  # silence warning about initialization outside constructor
@@ -266,6 +591,9 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        # with HTTP/1.1 keep-alive the client needs this to delimit the
+        # (empty) body, or the preflight hangs waiting for a close
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
     # === GET ===
@@ -274,7 +602,9 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
 
         Routes:
           * `/app`: Return the web page
-          * `/fs`: Retrieve an updated flowsheet.
+          * `/fs`: Retrieve an updated flowsheet. Add `refresh` to the query
+            to force re-serialization of the model (used by the frontend
+            refresh action after Python-side model changes).
           * `/setting`: Retrieve a setting value.
           * `/path/to/file`: Retrieve file stored static directory
         """
@@ -294,6 +624,10 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
         if u.path == "/app":
             self._get_app(id_)
         elif u.path == "/fs":
+            if queries.get("refresh") is not None:
+                # serialized flowsheets are cached; the client is telling us
+                # the model changed in ways the server can't observe
+                self.server.mark_dirty(id_)
             self._get_fs(id_)
         elif u.path == "/setting":
             setting_key_ = queries.get("setting_key", None) if queries else None
@@ -311,35 +645,121 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
             self.directory = str(_static_dir)  # keep here: overwritten if set earlier
             super().do_GET()
 
+    #: Static files up to this size (256 KB) are cached in memory
+    _FILE_CACHE_MAX = 256 * 1024
+    #: Number of files kept in the static-file cache
+    _FILE_CACHE_SLOTS = 64
+    _file_cache = {}  # (path, mtime) -> bytes; shared by all handler threads
+    _file_cache_lock = threading.Lock()
+
+    def copyfile(self, source, outputfile):
+        """Copy a static file to the client, avoiding user-space buffering.
+
+        Small files are served from an in-memory cache keyed by path and
+        modification time; larger ones are sent with `os.sendfile()`, which
+        copies from the file to the socket inside the kernel. Anything that
+        doesn't fit those paths falls back to the base implementation.
+        """
+        try:
+            in_fd = source.fileno()
+            st = os.fstat(in_fd)
+        except (AttributeError, OSError, ValueError):
+            # not a regular file (e.g. an in-memory directory listing)
+            return super().copyfile(source, outputfile)
+        if st.st_size <= self._FILE_CACHE_MAX:
+            key = (source.name, st.st_mtime_ns)
+            with self._file_cache_lock:
+                data = self._file_cache.get(key)
+            if data is None:
+                data = source.read()
+                with self._file_cache_lock:
+                    if len(self._file_cache) >= self._FILE_CACHE_SLOTS:
+                        # evict the oldest entry (dicts keep insertion order)
+                        self._file_cache.pop(next(iter(self._file_cache)))
+                    self._file_cache[key] = data
+            outputfile.write(data)
+            return
+        if hasattr(os, "sendfile"):
+            outputfile.flush()  # push out headers buffered in the writer
+            offset, remaining = 0, st.st_size
+            try:
+                while remaining > 0:
+                    sent = os.sendfile(outputfile.fileno(), in_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                return
+            except OSError:
+                if offset:  # partial send: can't safely restart
+                    raise
+                # sendfile unsupported for this pair of files: fall through
+        super().copyfile(source, outputfile)
+
     def _get_app(self, id_):
-        """Read index file, process to insert flowsheet identifier, and return it."""
-        p = Path(_template_dir / "index.html")
-        with open(p, "r", encoding="utf-8") as fp:
-            s = fp.read()
-            page = s.format(flowsheet_id=id_)
-        self._write_html(200, page)
+        """Insert the flowsheet identifier into the cached index page and return it."""
+        page = utf8_encode(id_).join(self.server._app_parts)
+        etag = f'"{hashlib.blake2b(page, digest_size=16).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._write_not_modified(etag)
+            return
+        self._write_html(200, page, etag=etag)
 
     def _get_fs(self, id_: str):
         """Get updated flowsheet.
 
+        Concurrent requests for the same flowsheet are coalesced: the first
+        one computes the update, and the others wait briefly and reuse its
+        encoded response instead of repeating the serialize-and-diff work.
+
         Args:
             id_: Flowsheet identifier
 
         Returns:
             None
         """
+        server = self.server
+        with server._lock:
+            inflight = server._inflight.get(id_)
+            if inflight is None:
+                server._inflight[id_] = inflight = [threading.Event(), None]
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            # on timeout or leader failure, fall through and compute our own
+            if inflight[0].wait(timeout=2.0) and inflight[1] is not None:
+                self._write_fs_response(*inflight[1])
+                return
         try:
-            merged = self.server.update_flowsheet(id_)
-        except errors.FlowsheetUnknown as err:
-            # User error: user asked for a flowsheet by an unknown ID
-            self.send_error(404, message=str(err))
-            return
-        except (errors.FlowsheetNotFound, errors.ProcessingError) as err:
-            # Internal error: flowsheet ID is found, but other things are missing
-            self.send_error(500, message=str(err))
-            return
+            try:
+                value, etag = server.get_fs_response(id_)
+            except errors.FlowsheetUnknown as err:
+                # User error: user asked for a flowsheet by an unknown ID
+                self.send_error(404, message=str(err))
+                return
+            except (errors.FlowsheetNotFound, errors.ProcessingError) as err:
+                # Internal error: flowsheet ID is found, but other things are missing
+                self.send_error(500, message=str(err))
+                return
+            if leader:
+                inflight[1] = (value, etag)
+        finally:
+            if leader:
+                # wake any waiters, even if the update failed (they recompute)
+                with server._lock:
+                    server._inflight.pop(id_, None)
+                inflight[0].set()
         # Return merged flowsheet
-        self._write_json(200, merged)
+        self._write_fs_response(value, etag)
+
+    def _write_fs_response(self, value: bytes, etag: str):
+        """Write a /fs response, answering a matching If-None-Match with 304."""
+        quoted = f'"{etag}"'
+        if self.headers.get("If-None-Match") == quoted:
+            self._write_not_modified(quoted)
+            return
+        self._write_json_fast(200, value, etag=quoted)
 
     def _get_setting(self, setting_key_: str):
         """Get setting value.
@@ -403,6 +823,11 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
             self._write_text(500, message=str(err))
             return
 
+        # A PUT is how the UI's refresh action announces itself (save the
+        # client layout, then re-fetch), so treat it as a signal that the
+        # Python-side model may have changed and re-serialize on the next /fs
+        self.server.mark_dirty(id_)
+
         self._write_text(200, message="success")
 
     def _put_diagnostic(self, id_):
@@ -410,37 +835,32 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
             # TODO: id_ in here is not from query param but from frontend, if id_ from do_PUT is None
             # reading request json data
             content_length = int(self.headers.get("Content-Length", 0))
-            request_body = self.rfile.read(content_length).decode("utf-8")
-            request_data = json.loads(request_body)
+            request_body = self.rfile.read(content_length)
+            request_data = _decode_json(request_body)
 
             # get function name from request
             function_name = request_data.get("function_name", "")
             id_ = request_data.get("id", "")
 
-            # get fs
-            fs = self.server._get_flowsheet_obj(id_)
+            # get cached diagnosticToolbox instance and its callable methods
+            dt_instance, allowed = self.server._get_diag_toolbox(id_)
 
-            # create diagnosticToolbox instence
-            dt_instance = DiagnosticsToolbox(fs)
+            # look up the requested function in the whitelist of bound methods
+            current_function = allowed.get(function_name)
+            if current_function is None:
+                # client error: function doesn't exist or may not be called
+                self._write_json(400, {"error": f"Unknown function: {function_name}"})
+                return
 
-            # base on pass in function name as function name and run diagnosticToolBox.function_name
-            if hasattr(dt_instance, function_name):
-                # read dt function from dt instance
-                current_function = getattr(dt_instance, function_name)
-                # initial streamIO use as stream to capture diagnostics output or its default will print to terminal
-                output_stream = io.StringIO()
-                # run current function
-                current_function(stream=output_stream)
-            else:
-                # return error function not exists
-                self._write_json(500, {"error": f"Unknown function: {function_name}"})
+            # capture diagnostics output in a reusable per-thread buffer,
+            # or its default will print to terminal
+            output_stream = _diag_buffer()
+            # run current function
+            current_function(stream=output_stream)
 
-            # read captured output content
+            # read captured output content; the buffer is left open for reuse
             captured_output = output_stream.getvalue()
 
-            # close StreamIO
-            output_stream.close()
-
             # return respond
             self._write_json(200, {"diagnostics_runner_result": captured_output})
         except Exception as e:
@@ -466,35 +886,90 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
         self.wfile.write(value)
 
     def _write_json(self, code, data):
-        str_json = json.dumps(data)
+        self._write_json_value(code, _encode_json(data))
+
+    def _write_json_value(self, code, value: bytes):
         if _log.isEnabledFor(logging.DEBUG):
-            _log.debug(f"Sending JSON data:\n---begin---\n{str_json}\n---end---")
-        value = utf8_encode(str_json)
+            # %s-style formatting defers concatenating the (possibly large)
+            # body until a handler actually accepts the record
+            _log.debug(
+                "Sending JSON data:\n---begin---\n%s\n---end---", utf8_decode(value)
+            )
         self.send_response(code)
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Content-type", "application/json")
         self.send_header("Content-length", str(len(value)))
         self.end_headers()
-        self.wfile.write(value)
-
-    def _write_html(self, code, page):
-        value = utf8_encode(page)
+        self._write_body(value)
+
+    #: Invariant header blob for the hot JSON path; only the status code and
+    #: content length vary, so the whole prefix is emitted in one write
+    _JSON_HDR_FMT = (
+        b"HTTP/1.1 %d OK\r\n"
+        b"Access-Control-Allow-Origin: *\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: %d\r\n"
+        b"\r\n"
+    )
+    _JSON_HDR_ETAG_FMT = (
+        b"HTTP/1.1 %d OK\r\n"
+        b"Access-Control-Allow-Origin: *\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: %d\r\n"
+        b"ETag: %s\r\n"
+        b"\r\n"
+    )
+
+    def _write_json_fast(self, code, value: bytes, etag: str = None):
+        """Write a JSON response using the precomputed header blob.
+
+        Bypasses `send_response`/`send_header`, which format and buffer each
+        header line separately; used on the /fs path where the response shape
+        never varies.
+        """
+        if etag is None:
+            hdr = self._JSON_HDR_FMT % (code, len(value))
+        else:
+            hdr = self._JSON_HDR_ETAG_FMT % (code, len(value), etag.encode("ascii"))
+        self.wfile.write(hdr)
+        self._write_body(value)
+
+    #: Chunk size (64 KiB) for writing large response bodies
+    _WRITE_CHUNK = 1 << 16
+
+    def _write_body(self, value: bytes):
+        # write large payloads in chunks through memoryview slices, so a big
+        # flowsheet body is not copied wholesale into a single socket write
+        with memoryview(value) as view:
+            for start in range(0, len(view), self._WRITE_CHUNK):
+                self.wfile.write(view[start : start + self._WRITE_CHUNK])
+
+    def _write_html(self, code, page: Union[str, bytes], etag: str = None):
+        value = utf8_encode(page) if isinstance(page, str) else page
         self.send_response(code)
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Content-type", "text/html")
         self.send_header("Content-length", str(len(value)))
+        if etag is not None:
+            self.send_header("ETag", etag)
         self.end_headers()
         self.wfile.write(value)
 
+    def _write_not_modified(self, etag: str):
+        """Answer a conditional request whose ETag still matches."""
+        self.send_response(304)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("ETag", etag)
+        self.end_headers()
+
     def _parse_flowsheet_url(self, path):
-        u, queries = urlparse(path), None
-        # u = ParseResult(scheme='', netloc='', path='/app', params='', query='id=sample_visualization', fragment='')
+        # urlsplit skips the params field urlparse extracts, and parse_qsl
+        # drops malformed (non name=value) pairs like the old manual loop did
+        u, queries = urlsplit(path), None
+        # u = SplitResult(scheme='', netloc='', path='/app', query='id=sample_visualization', fragment='')
         if u.query:
-            queries = {}
-            for item in u.query.split("&"):
-                parts = item.split("=")
-                if len(parts) == 2:  # skip if not name=value pair
-                    queries[parts[0]] = parts[1]
+            # blank values are kept so flag-style params (e.g. "refresh") work
+            queries = dict(parse_qsl(u.query, keep_blank_values=True))
         return u, queries
 
     # === Logging ===
@@ -519,8 +994,10 @@ def utf8_decode(b: bytes):
 
 def find_free_port():
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # with SO_REUSEADDR the port can be rebound immediately, so there is no
+    # need to sleep for "socket cleanup" after closing the probe
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     s.bind(("127.0.0.1", 0))
     port = s.getsockname()[1]
     s.close()
-    time.sleep(1)  # wait for socket cleanup!!!
     return port
@@ -21,9 +21,18 @@ Currently implemented methods are trivial storage in memory and storage to a fil
 
 # stdlib
 from abc import ABC, abstractmethod
+import atexit
 import json
+import os
 from pathlib import Path
-from typing import Dict, Union
+import time
+from typing import Dict, Optional, Union
+
+# third-party
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # package
 from idaes import logger
@@ -31,6 +40,41 @@ from . import errors
 
 _log = logger.getLogger(__name__)
 
+#: Buffer size (1 MiB) for file I/O, so a save is one syscall for typical flowsheets
+_BUFFER_SIZE = 1 << 20
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize `obj` as JSON bytes.
+
+    Stdlib `json` is used here rather than `orjson`: serialized flowsheets can
+    contain NaN/Infinity values, which orjson silently rewrites to null, and
+    non-string keys, which it rejects instead of coercing. Saved data must
+    round-trip exactly, so writes stay on the stdlib encoder (reads still get
+    the fast path, see :func:`_json_loads`).
+
+    Raises:
+        TypeError, if the object is not JSON-serializable
+    """
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: Union[bytes, str]):
+    """Parse JSON from bytes or a string, with `orjson` if it is available.
+
+    Falls back to stdlib `json` for documents orjson rejects, such as the
+    NaN/Infinity tokens the stdlib encoder emits.
+
+    Raises:
+        ValueError, if the input is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
+
 
 class DataStore(ABC):
     @abstractmethod
@@ -50,20 +94,22 @@ class DataStore(ABC):
         """
 
     @classmethod
-    def create(cls, dest=None) -> "DataStore":
+    def create(cls, dest=None, flush_interval: Optional[float] = None) -> "DataStore":
         """Factory method to create and return the appropriate DataStore subclass
         given a destination.
 
         Args:
             dest: If a string or Path, return a FileDataStore
+            flush_interval: Passed to :class:`FileDataStore`; ignored for
+                other destinations
 
         Raises:
             ValueError if `dest` can't be matched to a DataStore subclass.
         """
         if isinstance(dest, str):
-            return FileDataStore(Path(dest))
+            return FileDataStore(Path(dest), flush_interval=flush_interval)
         elif isinstance(dest, Path):
-            return FileDataStore(dest)
+            return FileDataStore(dest, flush_interval=flush_interval)
         elif dest is None:
             print("create memory store")
             return MemoryDataStore()
@@ -87,8 +133,23 @@ class DataStore(ABC):
 
 
 class FileDataStore(DataStore):
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, flush_interval: Optional[float] = None):
+        """Create a file-backed store.
+
+        Args:
+            path: File in which to store the data
+            flush_interval: If given, coalesce rapid saves: the serialized
+                data is buffered in memory and only written to disk when at
+                least this many seconds have passed since the last write (or
+                on :meth:`flush`, which also runs at interpreter exit). If
+                None, every save is written through immediately.
+        """
         self._p = path
+        self._flush_interval = flush_interval
+        self._pending = None  # serialized bytes not yet written to disk
+        self._last_write = None
+        if flush_interval is not None:
+            atexit.register(self.flush)
 
     @property
     def path(self) -> Path:
@@ -108,28 +169,56 @@ class FileDataStore(DataStore):
             DataStoreError, if serialization or I/O fails
         """
         _log.debug(f"Save to file: {self._p}")
+        # serialize (and thereby validate) up front, even if the write is deferred
+        if isinstance(data, dict):
+            try:
+                value = _json_dumps(data)
+            except TypeError as err:
+                raise errors.DatastoreSerializeError(data, err)
+        else:
+            _parse_json(data)  # validation
+            value = str(data).encode("utf-8")
+        if self._flush_interval is not None:
+            self._pending = value
+            if (
+                self._last_write is not None
+                and time.monotonic() - self._last_write < self._flush_interval
+            ):
+                return  # too soon: keep buffered until the next flush point
+        self._write(value)
+
+    def flush(self):
+        """Write any buffered save to disk."""
+        if self._pending is not None:
+            self._write(self._pending)
+
+    def _write(self, value: bytes):
+        # write to a temporary file and atomically rename it over the target,
+        # so a crash mid-save can't leave a truncated or empty file behind
+        tmp = self._p.with_suffix(self._p.suffix + ".tmp")
         try:
-            with self._p.open("w") as fp:
-                if isinstance(data, dict):
-                    try:
-                        json.dump(data, fp)
-                    except TypeError as err:
-                        raise errors.DatastoreSerializeError(data, err, stream=fp)
-                else:
-                    _parse_json(data)  # validation
-                    fp.write(str(data))
+            with tmp.open("wb", buffering=_BUFFER_SIZE) as fp:
+                fp.write(value)
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(tmp, self._p)
         except ValueError as err:
             raise errors.DatastoreError(str(err))
         except IOError as err:
             raise errors.DatastoreSaveError(f"IO error with datastore: {err}")
+        self._pending = None
+        self._last_write = time.monotonic()
 
     def load(self):
         _log.debug(f"Load from file: {self._p}")
+        if self._pending is not None:
+            # buffered save not yet on disk is the most recent value
+            return _json_loads(self._pending)
         try:
-            with self._p.open("r") as fp:
+            with self._p.open("rb", buffering=_BUFFER_SIZE) as fp:
                 try:
-                    data = json.load(fp)
-                except json.JSONDecodeError as err:
+                    data = _json_loads(fp.read())
+                except ValueError as err:
                     raise ValueError(f"Reading JSON failed: {err}")
         except FileNotFoundError:
             # normalize errors finding stored object to ValueError
@@ -165,7 +254,7 @@ class MemoryDataStore(DataStore):
         """
         if isinstance(data, dict):
             try:
-                json.dumps(data)
+                _json_dumps(data)
             except TypeError as err:
                 raise errors.DatastoreSerializeError(data, err)
             self._data = data
@@ -189,8 +278,8 @@ def _parse_json(data) -> Dict:
     """
     s = str(data)
     try:
-        data = json.loads(s)
-    except json.decoder.JSONDecodeError as err:
+        data = _json_loads(s)
+    except ValueError as err:
         err2 = f"could not decode string of JSON: {err}"
         raise errors.DatastoreSerializeError(s[:256], err2)
     return data
@@ -1,5 +1,6 @@
 import os
 import asyncio
+import atexit
 import nest_asyncio
 from IPython.display import clear_output
 from .model_server import FlowsheetServer
@@ -8,6 +9,55 @@ import logging
 
 _log = logging.getLogger(__name__)
 
+# Shared headless browser, reused across save_diagram_screenshot calls.
+# Launching Chromium costs seconds; each call gets its own (cheap) browser
+# context so pages and downloads stay isolated.
+_playwright = None
+_browser = None
+
+
+async def _get_browser():
+    """Return the shared headless browser, launching it on first use."""
+    global _playwright, _browser
+    if _browser is None or not _browser.is_connected():
+        from playwright.async_api import async_playwright
+
+        _playwright = await async_playwright().start()
+        _browser = await _playwright.chromium.launch(
+            headless=True, args=["--no-sandbox"]
+        )
+    return _browser
+
+
+async def _close_browser():
+    """Close the shared browser and stop Playwright."""
+    global _playwright, _browser
+    if _browser is not None:
+        try:
+            await _browser.close()
+        finally:
+            _browser = None
+    if _playwright is not None:
+        try:
+            await _playwright.stop()
+        finally:
+            _playwright = None
+
+
+def _shutdown_browser():
+    """atexit hook: close the shared browser if one was launched."""
+    if _browser is None:
+        return
+    try:
+        loop = asyncio.get_event_loop()
+        if not loop.is_closed():
+            loop.run_until_complete(_close_browser())
+    except Exception:  # pylint: disable=W0703
+        pass  # interpreter is exiting; daemon cleanup is best-effort
+
+
+atexit.register(_shutdown_browser)
+
 
 class SaveDiagramScreenshot:
     def __init__(
@@ -129,159 +179,154 @@ class SaveDiagramScreenshot:
             image_type: string the screenshot image type
             display: bool to display or not display it in jupyter
         """
-        # import playwright to generate screenshot
-        from playwright.async_api import async_playwright
         from IPython.display import SVG
         from IPython.display import Image
         from IPython.display import display as IPythonDisplay
 
-        async with async_playwright() as p:
-            try:
-                # launch browser
-                _log.info("launching browser, Max timeout 30s")
-                browser = await p.chromium.launch(headless=True, args=["--no-sandbox"])
-                context = await browser.new_context(
-                    viewport={"width": 1920, "height": 1080}
-                )
-                _log.info("browser launched")
-
-                # load page
-                _log.info("loading page")
-                page = await context.new_page()
-                _log.info("page loaded")
-
-                # Go to visualizer URL and wait document load
-                _log.info(f"going to {live_server_url} waiting for document load")
-                await page.goto(live_server_url)
-                await page.wait_for_load_state("networkidle")
-                _log.info("web document loaded")
-
-                # Hover on download menu show download option list
-                _log.info("hover on download menu show download option list")
-                await page.hover("#diagram_download_icon", timeout=10000)
-
-                # Base on image_type to click different image download btn
-                _log.info(f"clicking {image_type} download btn")
-                if image_type == "png":
-                    await page.click("#headerExportImageBtn", timeout=10000)
-                elif image_type == "svg":
-                    await page.click("#headerExportSvgBtn", timeout=10000)
-                else:
-                    error_msg = f"image type {image_type} is not supported, it should not shown in this function go check the save_diagram function"
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
+        # get shared browser (launched on first use, then kept warm)
+        _log.info("acquiring browser, Max timeout 30s")
+        browser = await _get_browser()
+        context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+        _log.info("browser context ready")
 
-                # Checking after click download which type of screenshot button, the download button should show up.
-                _log.info(
-                    "Screenshot type button clicked, now checking if it downloadable"
-                )
-                try:
-                    download_button = page.locator(".control-button")
-                    await download_button.wait_for(state="visible", timeout=10000)
-                    if not await download_button.is_visible():
-                        error_msg = (
-                            "Download button not found, can't download screenshot"
-                        )
-                        _log.error(error_msg)
-                        raise ValueError(error_msg)
-                except TimeoutError:
-                    error_msg = "Timeout waiting for download button to appear"
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
-
-                # Click download btn on UI pop modal
-                async with page.expect_download() as download:
-                    await page.click(".control-button")
-
-                # Get download value
-                download_item = await download.value
-
-                # Wait for download to complete
-                download_path = await download_item.path()
-
-                # double check download path is exist
-                if not download_path or not os.path.exists(download_path):
-                    error_msg = f"Download path {download_path} not exist"
-                    _log.error(error_msg)
-                    # if raise this error need to check playwright download function why has download item but no download path
-                    raise ValueError(error_msg)
+        try:
+            # load page
+            _log.info("loading page")
+            page = await context.new_page()
+            _log.info("page loaded")
+
+            # Go to visualizer URL and wait document load
+            _log.info(f"going to {live_server_url} waiting for document load")
+            await page.goto(live_server_url)
+            await page.wait_for_load_state("networkidle")
+            _log.info("web document loaded")
+
+            # Hover on download menu show download option list
+            _log.info("hover on download menu show download option list")
+            await page.hover("#diagram_download_icon", timeout=10000)
+
+            # Base on image_type to click different image download btn
+            _log.info(f"clicking {image_type} download btn")
+            if image_type == "png":
+                await page.click("#headerExportImageBtn", timeout=10000)
+            elif image_type == "svg":
+                await page.click("#headerExportSvgBtn", timeout=10000)
+            else:
+                error_msg = f"image type {image_type} is not supported, it should not shown in this function go check the save_diagram function"
+                _log.error(error_msg)
+                raise ValueError(error_msg)
 
-                # check we can read and write in download path
-                if not os.access(download_path, os.R_OK) or not os.access(
-                    download_path, os.W_OK
-                ):
+            # Checking after click download which type of screenshot button, the download button should show up.
+            _log.info(
+                "Screenshot type button clicked, now checking if it downloadable"
+            )
+            try:
+                download_button = page.locator(".control-button")
+                await download_button.wait_for(state="visible", timeout=10000)
+                if not await download_button.is_visible():
                     error_msg = (
-                        f"Can't read and write in download path: {download_path}"
+                        "Download button not found, can't download screenshot"
                     )
                     _log.error(error_msg)
                     raise ValueError(error_msg)
-
-                customized_screenshot_save_path = os.path.join(
-                    save_to, f"{screenshot_name}.{image_type}"
+            except TimeoutError:
+                error_msg = "Timeout waiting for download button to appear"
+                _log.error(error_msg)
+                raise ValueError(error_msg)
+
+            # Click download btn on UI pop modal
+            async with page.expect_download() as download:
+                await page.click(".control-button")
+
+            # Get download value
+            download_item = await download.value
+
+            # Wait for download to complete
+            download_path = await download_item.path()
+
+            # double check download path is exist
+            if not download_path or not os.path.exists(download_path):
+                error_msg = f"Download path {download_path} not exist"
+                _log.error(error_msg)
+                # if raise this error need to check playwright download function why has download item but no download path
+                raise ValueError(error_msg)
+
+            # check we can read and write in download path
+            if not os.access(download_path, os.R_OK) or not os.access(
+                download_path, os.W_OK
+            ):
+                error_msg = (
+                    f"Can't read and write in download path: {download_path}"
                 )
+                _log.error(error_msg)
+                raise ValueError(error_msg)
 
-                # relocated download screenshot to save path
-                # read from download screenshot file
-                try:
-                    _log.info(
-                        f"Moving download screenshot from {download_path} to {customized_screenshot_save_path}"
-                    )
-                    with open(download_path, "rb") as source_file:
-                        file_content = source_file.read()
-                    # write to save path
-                    with open(customized_screenshot_save_path, "wb") as target_file:
-                        target_file.write(file_content)
-                except Exception as e:
-                    error_msg = f"Failed to move download screenshot from {download_path}  to {customized_screenshot_save_path}: Error message{e}"
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
-
-                # clean up temp playwright downloaded screenshot temp file
-                if customized_screenshot_save_path != download_path and os.path.exists(
-                    download_path
-                ):
-                    os.remove(download_path)
+            customized_screenshot_save_path = os.path.join(
+                save_to, f"{screenshot_name}.{image_type}"
+            )
 
-                # check if screenshot is saved successfully
-                if os.path.exists(customized_screenshot_save_path):
-                    _log.info(
-                        f"Screenshot downloaded at: {customized_screenshot_save_path}"
-                    )
-                else:
-                    error_msg = f"screenshot fail to save, at after try to move download screenshot to save path"
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
+            # relocated download screenshot to save path
+            # read from download screenshot file
+            try:
+                _log.info(
+                    f"Moving download screenshot from {download_path} to {customized_screenshot_save_path}"
+                )
+                with open(download_path, "rb") as source_file:
+                    file_content = source_file.read()
+                # write to save path
+                with open(customized_screenshot_save_path, "wb") as target_file:
+                    target_file.write(file_content)
+            except Exception as e:
+                error_msg = f"Failed to move download screenshot from {download_path}  to {customized_screenshot_save_path}: Error message{e}"
+                _log.error(error_msg)
+                raise ValueError(error_msg)
+
+            # clean up temp playwright downloaded screenshot temp file
+            if customized_screenshot_save_path != download_path and os.path.exists(
+                download_path
+            ):
+                os.remove(download_path)
+
+            # check if screenshot is saved successfully
+            if os.path.exists(customized_screenshot_save_path):
+                _log.info(
+                    f"Screenshot downloaded at: {customized_screenshot_save_path}"
+                )
+            else:
+                error_msg = f"screenshot fail to save, at after try to move download screenshot to save path"
+                _log.error(error_msg)
+                raise ValueError(error_msg)
 
-                # check if current environment is jupyter notebook
-                in_jupyter = self._is_jupyter()
+            # check if current environment is jupyter notebook
+            in_jupyter = self._is_jupyter()
 
-                # if user is not in jupyter and want to display the screenshot log error
-                if not in_jupyter and display:
-                    _log.error(
-                        "Currently only support display screenshot in Jupyter environment"
-                    )
-                    _log.error(
-                        f"Your diagram screenshot is saved at: {customized_screenshot_save_path}"
-                    )
+            # if user is not in jupyter and want to display the screenshot log error
+            if not in_jupyter and display:
+                _log.error(
+                    "Currently only support display screenshot in Jupyter environment"
+                )
+                _log.error(
+                    f"Your diagram screenshot is saved at: {customized_screenshot_save_path}"
+                )
 
-                # check if user want to display the screenshot
-                if in_jupyter and display:
-                    if image_type == "svg":
-                        # display svg and display screenshot
-                        IPythonDisplay(SVG(filename=customized_screenshot_save_path))
-                    elif image_type == "png":
-                        # display png images
-                        IPythonDisplay(Image(filename=customized_screenshot_save_path))
+            # check if user want to display the screenshot
+            if in_jupyter and display:
+                if image_type == "svg":
+                    # display svg and display screenshot
+                    IPythonDisplay(SVG(filename=customized_screenshot_save_path))
+                elif image_type == "png":
+                    # display png images
+                    IPythonDisplay(Image(filename=customized_screenshot_save_path))
 
-                return {"diagram_saved_path": customized_screenshot_save_path}
+            return {"diagram_saved_path": customized_screenshot_save_path}
 
-            except Exception as e:
-                _log.info(f"_async_save_diagram error: {e}")
-                raise e
+        except Exception as e:
+            _log.info(f"_async_save_diagram error: {e}")
+            raise e
 
-            finally:
-                # close browser any way
-                await browser.close()
+        finally:
+            # close only this call's context; the browser stays warm for reuse
+            await context.close()
 
     def _validate_and_create_save_path(self, save_to):
         """
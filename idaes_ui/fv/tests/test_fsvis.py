@@ -90,6 +90,8 @@ def test_visualize(flash_model, tmp_path):
     assert unit_images == ["feed.svg", "flash.svg", "product.svg", "product.svg"]
     # Modify the model by deleting its one and only component
     flowsheet.del_component("flash")
+    # Tell the server the model changed, since serialized flowsheets are cached
+    result.server.mark_dirty("Flash")
     # Get the model (again)
     resp = requests.get(f"http://127.0.0.1:{result.port}/fs?id=Flash")
     data = resp.json()
@@ -125,6 +127,38 @@ def test_save_visualization(flash_model, tmp_path):
     assert file_data == net_data
 
 
+@pytest.mark.integration
+def test_fs_etag_not_modified(flash_model):
+    result = fsvis.visualize(flash_model.fs, "FlashETag", browser=False, save=False)
+    url = f"http://127.0.0.1:{result.port}/fs?id=FlashETag"
+    first = requests.get(url)
+    assert first.status_code == 200
+    # an unchanged poll with the returned ETag gets a bodyless 304
+    second = requests.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+    assert not second.content
+
+
+@pytest.mark.integration
+def test_app_etag_not_modified(flash_model):
+    result = fsvis.visualize(flash_model.fs, "FlashAppETag", browser=False, save=False)
+    url = f"http://127.0.0.1:{result.port}/app?id=FlashAppETag"
+    first = requests.get(url)
+    assert first.status_code == 200
+    second = requests.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+
+
+@pytest.mark.integration
+def test_diagnostics_unknown_function(flash_model):
+    result = fsvis.visualize(flash_model.fs, "FlashDiagFn", browser=False, save=False)
+    url = f"http://127.0.0.1:{result.port}/run_diagnostic"
+    resp = requests.put(
+        url, json={"function_name": "no_such_function", "id": "FlashDiagFn"}
+    )
+    assert resp.status_code == 400
+
+
 def _canonicalize(d):
     for cell in d["cells"]:
         if "ports" in cell:
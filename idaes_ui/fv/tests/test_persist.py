@@ -40,6 +40,41 @@ def test_file_data_store(tmp_path):
     _save_and_load_data(store)
 
 
+@pytest.mark.unit
+def test_file_data_store_flush_interval(tmp_path):
+    p = tmp_path / "test.json"
+    store = persist.FileDataStore(p, flush_interval=60.0)
+    store.save({"value": 1})  # first save always writes through
+    assert json.loads(p.read_text()) == {"value": 1}
+    store.save({"value": 2})  # within the interval: buffered in memory
+    assert json.loads(p.read_text()) == {"value": 1}
+    assert store.load() == {"value": 2}  # load() sees the buffered save
+    store.flush()  # also registered to run at interpreter exit
+    assert json.loads(p.read_text()) == {"value": 2}
+
+
+@pytest.mark.unit
+def test_file_data_store_atomic(tmp_path):
+    p = tmp_path / "test.json"
+    tmp_file = p.with_suffix(p.suffix + ".tmp")
+    store = persist.FileDataStore(p)
+    store.save(data)
+    assert not tmp_file.exists()
+    with pytest.raises(errors.DatastoreError):
+        store.save(bad_data)
+    # a failed save leaves the previous contents, and no temp file, behind
+    assert json.loads(p.read_text()) == data
+    assert not tmp_file.exists()
+
+
+@pytest.mark.unit
+def test_file_data_store_nan_roundtrip(tmp_path):
+    store = persist.FileDataStore(tmp_path / "test.json")
+    store.save({"value": float("nan")})
+    value = store.load()["value"]
+    assert value != value  # still NaN after the round-trip
+
+
 @pytest.mark.unit
 def test_memory_data_store():
     store = persist.MemoryDataStore()